@@ -16,28 +16,36 @@ Environment variables:
                         desktop if not running. Set to 'false' to disable.
                         On connection failure, will attempt to launch Joplin and
                         retry once after a 2 second wait.
+    JOPLIN_SKIP_DOTENV: (Optional) Set to '1' to skip reading a .env file
+                        at startup.
 """
 
 import asyncio
+import functools
 import json
 import os
 import shutil
 import subprocess
 import time
-from datetime import datetime
+from collections import OrderedDict
+from contextlib import asynccontextmanager, suppress
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, Optional
 
-from dotenv import load_dotenv
+# Load .env file if present, unless explicitly disabled
+if os.environ.get("JOPLIN_SKIP_DOTENV") != "1":
+    from dotenv import load_dotenv
 
-load_dotenv()  # Load .env file if present
+    load_dotenv()
 
 import httpx
 from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
-# Initialize the MCP server
-mcp = FastMCP("joplin_mcp")
+try:
+    import orjson  # Optional: much faster JSON encoding and decoding
+except ImportError:
+    orjson = None
 
 # Constants
 DEFAULT_PORT = 41184
@@ -46,7 +54,117 @@ AUTO_LAUNCH_ENABLED = os.environ.get("JOPLIN_AUTO_LAUNCH", "true").lower() == "t
 LAUNCH_WAIT_SECONDS = 2.0
 MAX_LAUNCH_RETRIES = 1  # Only retry once to avoid masking other issues
 ENSURE_RUNNING_TIMEOUT = 25.0  # Max seconds to wait for Joplin to become ready (AppImage can be slow)
-ENSURE_RUNNING_POLL_INTERVAL = 1.0  # Seconds between API readiness checks
+ENSURE_RUNNING_POLL_INITIAL = 0.05  # First delay between API readiness checks (doubles each retry)
+ENSURE_RUNNING_POLL_MAX = 1.0  # Cap on the delay between API readiness checks
+PORT_PROBE_TIMEOUT = 0.2  # Seconds to wait for a TCP connect before trying /ping
+PROCESS_CHECK_TTL = 1.0  # Seconds to reuse the last Joplin process check
+HTTP_MAX_CONNECTIONS = 64  # Upper bound on concurrent connections to the Joplin API
+HTTP_MAX_KEEPALIVE = 32  # Idle connections kept open for reuse between tool calls
+PAGINATION_CONCURRENCY = 4  # Pages fetched in parallel by _get_all_paginated
+CACHE_TTL_SECONDS = 15.0  # How long folder/tag listings are served from memory
+NOTE_META_CACHE_TTL = 30.0  # How long get_note metadata (without body) is served from memory
+NOTE_META_CACHE_SIZE = 512  # Most notes whose metadata is kept
+
+# Joplin API field selections
+_NOTE_FIELDS = "id,title,parent_id,updated_time,created_time,is_todo,todo_completed,source_url"
+_NOTE_FIELDS_WITH_BODY = _NOTE_FIELDS + ",body"
+_NOTE_LIST_FIELDS = "id,title,parent_id,updated_time,created_time,is_todo,todo_completed"
+_SEARCH_NOTE_FIELDS = "id,title,parent_id,updated_time,is_todo,todo_completed"
+_NOTE_SUMMARY_FIELDS = "id,title,updated_time,is_todo,todo_completed"  # Markdown list/search rows
+
+
+# =============================================================================
+# HTTP Client
+# =============================================================================
+
+# (port, token), read from the environment on first use once a token is set
+_API_CONFIG: Optional[tuple[str, str]] = None
+
+
+def _get_api_config() -> tuple[str, str]:
+    """Get API port and token (empty if not set yet)."""
+    global _API_CONFIG
+    if _API_CONFIG is not None:
+        return _API_CONFIG
+    config = (str(os.environ.get("JOPLIN_PORT", DEFAULT_PORT)), os.environ.get("JOPLIN_TOKEN", ""))
+    # Don't memoize a missing token, so one set later is picked up
+    if config[1]:
+        _API_CONFIG = config
+    return config
+
+
+def _get_api_token() -> str:
+    """Get the API token, raising if it is not configured."""
+    token = _get_api_config()[1]
+    if not token:
+        raise ValueError(
+            "JOPLIN_TOKEN environment variable not set. "
+            "Get your token from: Joplin → Tools → Options → Web Clipper"
+        )
+    return token
+
+
+async def _reset_api_config() -> None:
+    """Forget the cached API config and client so the environment is read again (tests)."""
+    global _API_CONFIG
+    _API_CONFIG = None
+    await _close_client()
+
+
+# Shared client so keep-alive connections are reused across tool calls
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        port, _ = _get_api_config()
+        _client = httpx.AsyncClient(
+            base_url=f"http://localhost:{port}",
+            limits=httpx.Limits(
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+                max_connections=HTTP_MAX_CONNECTIONS,
+            ),
+            # Short connect/pool timeouts so a stopped Joplin fails fast into auto-launch
+            timeout=httpx.Timeout(connect=2.0, read=10.0, write=10.0, pool=2.0),
+        )
+    return _client
+
+
+async def _close_client() -> None:
+    """Close the shared HTTP client if it was opened."""
+    global _client
+    # Detach first so callers arriving during aclose() get a fresh client
+    client, _client = _client, None
+    if client is not None:
+        await client.aclose()
+
+
+# Sessions currently inside _lifespan
+_active_sessions = 0
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """
+    Release pooled connections when the last session ends.
+
+    The SSE and streamable HTTP transports enter the lifespan once per
+    session, so the shared client must outlive any single session.
+    """
+    global _active_sessions
+    _active_sessions += 1
+    try:
+        yield
+    finally:
+        _active_sessions -= 1
+        if not _active_sessions:
+            await _close_client()
+
+
+# Initialize the MCP server
+mcp = FastMCP("joplin_mcp", lifespan=_lifespan)
 
 
 # =============================================================================
@@ -54,8 +172,54 @@ ENSURE_RUNNING_POLL_INTERVAL = 1.0  # Seconds between API readiness checks
 # =============================================================================
 
 
+# Last process check result: (checked_at, running)
+_process_check: Optional[tuple[float, bool]] = None
+
+
 def _is_joplin_running() -> bool:
-    """Check if Joplin desktop is running."""
+    """
+    Check if Joplin desktop is running.
+
+    Scans /proc directly where available and falls back to pgrep elsewhere.
+    Results are reused for PROCESS_CHECK_TTL seconds so bursts of failed
+    requests don't rescan the process table.
+    """
+    global _process_check
+    now = time.monotonic()
+    if _process_check is not None and now - _process_check[0] < PROCESS_CHECK_TTL:
+        return _process_check[1]
+
+    if os.path.isdir("/proc"):
+        running = _scan_proc_for_joplin()
+    else:
+        running = _pgrep_joplin()
+
+    _process_check = (now, running)
+    return running
+
+
+def _scan_proc_for_joplin() -> bool:
+    """Match 'joplin' against each process command line, like pgrep -f."""
+    own_pid = str(os.getpid())
+    try:
+        pids = os.listdir("/proc")
+    except OSError:
+        return _pgrep_joplin()
+
+    for pid in pids:
+        if not pid.isdigit() or pid == own_pid:
+            continue
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                if b"joplin" in f.read():
+                    return True
+        except OSError:
+            continue  # Process exited or is not readable
+    return False
+
+
+def _pgrep_joplin() -> bool:
+    """Check for a Joplin process using pgrep (non-Linux fallback)."""
     try:
         result = subprocess.run(
             ["pgrep", "-f", "joplin"],
@@ -127,6 +291,47 @@ def _launch_joplin() -> bool:
     return False
 
 
+# Serializes auto-launch so concurrent failing requests start Joplin only once
+_launch_lock = asyncio.Lock()
+_launch_generation = 0  # Bumped after each auto-launch
+
+
+async def _auto_launch_joplin() -> bool:
+    """
+    Launch Joplin for a failed request unless it is already running.
+
+    Returns True if the request should be retried: either this call
+    launched Joplin, or a concurrent request did while this one waited.
+    """
+    global _launch_generation
+    seen = _launch_generation
+    async with _launch_lock:
+        if _launch_generation != seen:
+            return True
+        if _is_joplin_running() or not _launch_joplin():
+            return False
+        # Wait for Joplin to start and enable Web Clipper
+        await asyncio.sleep(LAUNCH_WAIT_SECONDS)
+        _launch_generation += 1
+        return True
+
+
+async def _is_port_open(port: int | str, timeout: float = PORT_PROBE_TIMEOUT) -> bool:
+    """Check whether anything accepts TCP connections on localhost:port."""
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection("localhost", int(port)), timeout
+        )
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return True
+
+
 async def _wait_for_joplin_api_ready(timeout: float = ENSURE_RUNNING_TIMEOUT) -> bool:
     """
     Poll until Joplin API is responsive.
@@ -137,25 +342,28 @@ async def _wait_for_joplin_api_ready(timeout: float = ENSURE_RUNNING_TIMEOUT) ->
     Returns:
         True if API became ready, False if timeout exceeded.
     """
-    port = os.environ.get("JOPLIN_PORT", DEFAULT_PORT)
-    token = os.environ.get("JOPLIN_TOKEN", "")
-    base_url = f"http://localhost:{port}"
-
-    start = time.time()
-    while time.time() - start < timeout:
-        try:
-            async with httpx.AsyncClient() as client:
+    port, token = _get_api_config()
+    client = _get_client()
+
+    # Back off exponentially so an already-running Joplin is detected quickly
+    delay = ENSURE_RUNNING_POLL_INITIAL
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        # A bare TCP connect is far cheaper than an HTTP request while Joplin is still starting
+        if await _is_port_open(port):
+            try:
                 # Use /ping endpoint to check API readiness
                 resp = await client.get(
-                    f"{base_url}/ping",
+                    "/ping",
                     params={"token": token},
                     timeout=2.0,
                 )
                 if resp.status_code == 200:
                     return True
-        except (httpx.ConnectError, httpx.ConnectTimeout):
-            pass
-        await asyncio.sleep(ENSURE_RUNNING_POLL_INTERVAL)
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                pass
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, ENSURE_RUNNING_POLL_MAX)
     return False
 
 
@@ -185,6 +393,17 @@ class NotesSortField(str, Enum):
 # =============================================================================
 
 
+class EnsureRunningInput(BaseModel):
+    """Input model for ensuring Joplin is running."""
+
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    prewarm: bool = Field(
+        default=True,
+        description="Pre-load notebook and tag lists so the next lookups are instant",
+    )
+
+
 class ListNotebooksInput(BaseModel):
     """Input model for listing notebooks."""
 
@@ -257,6 +476,7 @@ class CreateNoteInput(BaseModel):
     notebook_id: Optional[str] = Field(
         default=None,
         description="Notebook ID to create note in. Uses default notebook if not specified.",
+        serialization_alias="parent_id",
     )
     tags: Optional[list[str]] = Field(
         default=None,
@@ -267,6 +487,12 @@ class CreateNoteInput(BaseModel):
         description="Create as a to-do item instead of a regular note",
     )
 
+    @field_validator("notebook_id")
+    @classmethod
+    def blank_notebook_is_default(cls, v: Optional[str]) -> Optional[str]:
+        """Treat an empty notebook ID as 'use the default notebook'."""
+        return v or None
+
 
 class UpdateNoteInput(BaseModel):
     """Input model for updating a note."""
@@ -287,6 +513,7 @@ class UpdateNoteInput(BaseModel):
     notebook_id: Optional[str] = Field(
         default=None,
         description="Move note to different notebook",
+        serialization_alias="parent_id",
     )
     is_todo: Optional[bool] = Field(
         default=None,
@@ -353,6 +580,12 @@ class CreateNotebookInput(BaseModel):
         description="Parent notebook ID for creating a sub-notebook",
     )
 
+    @field_validator("parent_id")
+    @classmethod
+    def blank_parent_is_root(cls, v: Optional[str]) -> Optional[str]:
+        """Treat an empty parent ID as a top-level notebook."""
+        return v or None
+
 
 class TagNoteInput(BaseModel):
     """Input model for adding a tag to a note."""
@@ -373,21 +606,6 @@ class TagNoteInput(BaseModel):
 # =============================================================================
 
 
-def _get_api_config() -> tuple[str, str]:
-    """Get API base URL and token."""
-    token = os.environ.get("JOPLIN_TOKEN")
-    if not token:
-        raise ValueError(
-            "JOPLIN_TOKEN environment variable not set. "
-            "Get your token from: Joplin → Tools → Options → Web Clipper"
-        )
-
-    port = os.environ.get("JOPLIN_PORT", DEFAULT_PORT)
-    base_url = f"http://localhost:{port}"
-
-    return base_url, token
-
-
 async def _make_api_request(
     endpoint: str,
     method: str = "GET",
@@ -396,7 +614,7 @@ async def _make_api_request(
     _retry_count: int = 0,
 ) -> dict | list | None:
     """Make request to Joplin API with auto-launch retry."""
-    base_url, token = _get_api_config()
+    token = _get_api_token()
 
     # Add token to params
     if params is None:
@@ -404,36 +622,35 @@ async def _make_api_request(
     params["token"] = token
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
-                method,
-                f"{base_url}/{endpoint}",
-                json=json_data,
-                params=params,
-                timeout=30.0,
-            )
+        client = _get_client()
+        response = await client.request(
+            method,
+            f"/{endpoint}",
+            json=json_data,
+            params=params,
+        )
+        # Only build the HTTPStatusError path for non-2xx responses
+        if response.status_code >= 300:
             response.raise_for_status()
 
-            if response.status_code == 204 or not response.content:
-                return None
-            return response.json()
+        if response.status_code == 204 or not response.content:
+            return None
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
 
     except (httpx.ConnectError, httpx.ConnectTimeout) as e:
         # Auto-launch logic: only retry once
         if AUTO_LAUNCH_ENABLED and _retry_count < MAX_LAUNCH_RETRIES:
-            if not _is_joplin_running():
-                launched = _launch_joplin()
-                if launched:
-                    # Wait for Joplin to start and enable Web Clipper
-                    await asyncio.sleep(LAUNCH_WAIT_SECONDS)
-                    # Retry the request once
-                    return await _make_api_request(
-                        endpoint,
-                        method,
-                        json_data,
-                        params,
-                        _retry_count=_retry_count + 1,
-                    )
+            if await _auto_launch_joplin():
+                # Retry the request once
+                return await _make_api_request(
+                    endpoint,
+                    method,
+                    json_data,
+                    params,
+                    _retry_count=_retry_count + 1,
+                )
         # Re-raise if auto-launch disabled, already retried, or launch failed
         raise
 
@@ -442,65 +659,330 @@ async def _get_all_paginated(
     endpoint: str,
     params: Optional[dict] = None,
     limit: int = 100,
+    default_fields: str = "id,title",
 ) -> list:
-    """Fetch all items with pagination."""
-    if params is None:
-        params = {}
+    """
+    Fetch all items with pagination.
 
-    items = []
-    page = 1
+    The first page is fetched alone since most listings fit in one. If
+    more remain, the following pages are requested PAGINATION_CONCURRENCY
+    at a time and merged in order. Only as many pages as needed to reach
+    limit are requested, and anything fetched past the last page is
+    discarded. A limit of 0 fetches every page (up to the safety limit).
 
-    while True:
-        params["page"] = page
-        params["limit"] = min(limit, 100)
+    Without an explicit "fields" param Joplin returns every column,
+    including note bodies, so default_fields is requested instead.
+    """
+    params = dict(params or {})
+    params.setdefault("fields", default_fields)
 
-        result = await _make_api_request(endpoint, params=params)
+    page_size = min(limit, 100) if limit else 100
+    max_pages = 50  # Safety limit
+    if limit:
+        max_pages = min(max_pages, -(-limit // page_size))
 
-        if isinstance(result, dict) and "items" in result:
-            items.extend(result["items"])
-            if not result.get("has_more", False):
-                break
-        elif isinstance(result, list):
-            items.extend(result)
-            if len(result) < params["limit"]:
+    items = []
+    page = 1
+    window_size = 1
+
+    while page <= max_pages:
+        window = range(page, min(page + window_size, max_pages + 1))
+        results = await asyncio.gather(*(
+            _make_api_request(endpoint, params={**params, "page": p, "limit": page_size})
+            for p in window
+        ))
+
+        done = False
+        for result in results:
+            if isinstance(result, dict) and "items" in result:
+                items.extend(result["items"])
+                done = not result.get("has_more", False)
+            elif isinstance(result, list):
+                items.extend(result)
+                done = len(result) < page_size
+            else:
+                done = True
+            if done:
                 break
-        else:
-            break
-
-        page += 1
 
-        # Safety limit
-        if page > 50:
+        if done:
             break
+        page += len(window)
+        window_size = PAGINATION_CONCURRENCY
 
     return items[:limit] if limit else items
 
 
+# Listing cache: (endpoint, sorted params) -> (fetched_at, items)
+_cache: dict[tuple, tuple[float, Any]] = {}
+
+# Listing fetches in progress, shared by concurrent callers: key -> task
+_inflight: dict[tuple, asyncio.Task] = {}
+
+
+async def _cached_get_all(
+    endpoint: str,
+    params: Optional[dict] = None,
+    ttl: float = CACHE_TTL_SECONDS,
+) -> list:
+    """
+    Fetch all items with pagination, reusing results younger than ttl.
+
+    Concurrent callers asking for the same listing share a single fetch.
+    """
+    params = dict(params or {})
+    key = (endpoint, tuple(sorted(params.items())))
+
+    cached = _cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_into_cache(key, endpoint, params))
+        # Mark a failure as retrieved even if every waiter was cancelled
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        _inflight[key] = task
+    # Shield so one caller being cancelled doesn't cancel the shared fetch
+    return await asyncio.shield(task)
+
+
+async def _fetch_into_cache(key: tuple, endpoint: str, params: dict) -> list:
+    """Fetch a listing and cache it, unless it was invalidated meanwhile."""
+    this_task = asyncio.current_task()
+    try:
+        items = await _get_all_paginated(endpoint, params=params, limit=0)
+        if _inflight.get(key) is this_task:
+            _cache[key] = (time.monotonic(), items)
+        return items
+    finally:
+        if _inflight.get(key) is this_task:
+            del _inflight[key]
+
+
+def _invalidate_cache(endpoint: str) -> None:
+    """Drop cached and in-flight listings for an endpoint after a write."""
+    for store in (_cache, _inflight):
+        for key in [k for k in store if k[0] == endpoint]:
+            del store[key]
+
+
+def _per_listing(build: Callable[[list], Any]) -> Callable[[list], Any]:
+    """
+    Memoize a function of a listing on the identity of the list it is given.
+
+    Cached listings are replaced rather than mutated, so the result lives
+    exactly as long as the listing it was built from.
+    """
+    last: Optional[tuple[list, Any]] = None
+
+    @functools.wraps(build)
+    def wrapper(items: list) -> Any:
+        nonlocal last
+        if last is None or last[0] is not items:
+            last = (items, build(items))
+        return last[1]
+
+    return wrapper
+
+
+# get_note metadata (no body), least recently used first: note_id -> (fetched_at, note)
+_note_meta_cache: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+
+
+def _get_cached_note_meta(note_id: str) -> Optional[dict]:
+    """Return cached note metadata if still fresh, else None."""
+    cached = _note_meta_cache.get(note_id)
+    if cached is None:
+        return None
+    if time.monotonic() - cached[0] >= NOTE_META_CACHE_TTL:
+        del _note_meta_cache[note_id]
+        return None
+    _note_meta_cache.move_to_end(note_id)
+    return cached[1]
+
+
+def _cache_note_meta(note_id: str, note: dict) -> None:
+    """Remember note metadata, evicting the least recently used entries."""
+    _note_meta_cache[note_id] = (time.monotonic(), note)
+    _note_meta_cache.move_to_end(note_id)
+    while len(_note_meta_cache) > NOTE_META_CACHE_SIZE:
+        _note_meta_cache.popitem(last=False)
+
+
+async def _get_notebooks() -> list:
+    """Fetch all notebooks (id, title, parent_id), cached briefly."""
+    return await _cached_get_all(
+        "folders",
+        {"fields": "id,title,parent_id", "order_by": "title", "order_dir": "ASC"},
+    )
+
+
+async def _get_tags() -> list:
+    """Fetch all tags (id, title), cached briefly."""
+    return await _cached_get_all(
+        "tags",
+        {"fields": "id,title", "order_by": "title", "order_dir": "ASC"},
+    )
+
+
+@_per_listing
+def _index_tags(tags: list) -> dict[str, str]:
+    """Map lowercased tag title to tag ID. The first tag wins when titles collide."""
+    return {(t.get("title") or "").lower(): t["id"] for t in reversed(tags)}
+
+
+@_per_listing
+def _sort_tags(tags: list) -> list:
+    """Sort tags case-insensitively by title."""
+    return sorted(tags, key=lambda t: (t.get("title") or "").lower())
+
+
+async def _find_tag_id(tag_name: str) -> Optional[str]:
+    """
+    Get an existing tag's ID by name (case-insensitive), or None.
+
+    Known tags are resolved from the cached tag listing. The search API is
+    only used for names not found there, e.g. tags added in Joplin since
+    the listing was fetched.
+    """
+    needle = tag_name.lower()
+    tag_id = _index_tags(await _get_tags()).get(needle)
+    if tag_id:
+        return tag_id
+
+    # Search for existing tag
+    tags = await _make_api_request(
+        "search",
+        params={"query": tag_name, "type": "tag", "fields": "id,title"},
+    )
+
+    items = tags.get("items") if isinstance(tags, dict) else None
+    return next(
+        (t["id"] for t in items or () if (t.get("title") or "").lower() == needle),
+        None,
+    )
+
+
+async def _create_tag(tag_name: str) -> str:
+    """Create a tag and return its ID."""
+    new_tag = await _make_api_request(
+        "tags",
+        method="POST",
+        json_data={"title": tag_name},
+    )
+    _invalidate_cache("tags")
+    return new_tag["id"]
+
+
+async def _resolve_tag_id(tag_name: str) -> str:
+    """Get a tag's ID by name (case-insensitive), creating the tag if missing."""
+    return await _find_tag_id(tag_name) or await _create_tag(tag_name)
+
+
+async def _attach_tag(note_id: str, tag_id: str) -> None:
+    """Add a tag to a note."""
+    await _make_api_request(
+        f"tags/{tag_id}/notes",
+        method="POST",
+        json_data={"id": note_id},
+    )
+
+
+async def _ensure_and_attach_tag(note_id: str, tag_name: str) -> None:
+    """Find tag by name (case-insensitive), create it if missing, and add it to a note."""
+    await _attach_tag(note_id, await _resolve_tag_id(tag_name))
+
+
+async def _prewarm_cache() -> None:
+    """Load notebooks and tags into the cache in parallel, ignoring failures."""
+    await asyncio.gather(_get_notebooks(), _get_tags(), return_exceptions=True)
+
+
+@_per_listing
+def _index_notebooks(notebooks: list) -> dict[tuple[str, str], dict]:
+    """
+    Map (parent_id, lowercased title) to notebook.
+
+    The first notebook wins when titles collide.
+    """
+    return {
+        (nb.get("parent_id") or "", (nb.get("title") or "").lower()): nb
+        for nb in reversed(notebooks)
+    }
+
+
+_CONNECT_ERROR_MSG = (
+    "Error: Cannot connect to Joplin. Make sure:\n"
+    "1. Joplin desktop is running\n"
+    "2. Web Clipper service is enabled (Tools → Options → Web Clipper)\n"
+    "3. The API port matches JOPLIN_PORT (default: 41184)"
+    + (
+        "\n\nNote: Auto-launch was attempted but Joplin may not have started in time."
+        if AUTO_LAUNCH_ENABLED
+        else "\n\nTip: Set JOPLIN_AUTO_LAUNCH=true to auto-start Joplin."
+    )
+)
+_AUTH_ERROR_MSG = "Error: Invalid API token. Check JOPLIN_TOKEN is correct."
+_NOT_FOUND_ERROR_MSG = "Error: Resource not found. Check the ID is correct."
+_TIMEOUT_ERROR_MSG = "Error: Request timed out. Joplin may be busy or unresponsive."
+
+# Substring fallback for exceptions not classified by type, checked in order
+_ERROR_TABLE: tuple[tuple[tuple[str, ...], str], ...] = (
+    (("connection refused", "connect"), _CONNECT_ERROR_MSG),
+    (("401", "unauthorized", "forbidden"), _AUTH_ERROR_MSG),
+    (("404",), _NOT_FOUND_ERROR_MSG),
+    (("timeout",), _TIMEOUT_ERROR_MSG),
+)
+
+
 def _handle_error(e: Exception) -> str:
     """Format errors with actionable messages."""
+    # httpx errors carry their classification in the type or status code
+    if isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout)):
+        return _CONNECT_ERROR_MSG
+    if isinstance(e, httpx.HTTPStatusError):
+        status = e.response.status_code
+        if status in (401, 403):
+            return _AUTH_ERROR_MSG
+        if status == 404:
+            return _NOT_FOUND_ERROR_MSG
+    elif isinstance(e, httpx.TimeoutException):
+        return _TIMEOUT_ERROR_MSG
+
     error_str = str(e).lower()
+    for keywords, message in _ERROR_TABLE:
+        if any(keyword in error_str for keyword in keywords):
+            return message
 
-    if "connection refused" in error_str or "connect" in error_str:
-        auto_launch_note = ""
-        if AUTO_LAUNCH_ENABLED:
-            auto_launch_note = "\n\nNote: Auto-launch was attempted but Joplin may not have started in time."
-        else:
-            auto_launch_note = "\n\nTip: Set JOPLIN_AUTO_LAUNCH=true to auto-start Joplin."
+    return f"Error: {type(e).__name__}: {str(e)}"
 
-        return (
-            "Error: Cannot connect to Joplin. Make sure:\n"
-            "1. Joplin desktop is running\n"
-            "2. Web Clipper service is enabled (Tools → Options → Web Clipper)\n"
-            f"3. The API port matches JOPLIN_PORT (default: 41184){auto_launch_note}"
-        )
-    elif "401" in error_str or "unauthorized" in error_str or "forbidden" in error_str:
-        return "Error: Invalid API token. Check JOPLIN_TOKEN is correct."
-    elif "404" in error_str:
-        return "Error: Resource not found. Check the ID is correct."
-    elif "timeout" in error_str:
-        return "Error: Request timed out. Joplin may be busy or unresponsive."
 
-    return f"Error: {type(e).__name__}: {str(e)}"
+def _tool_errors(fn):
+    """Decorate a tool so any exception is returned as a _handle_error message."""
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await fn(*args, **kwargs)
+        except Exception as e:
+            return _handle_error(e)
+
+    return wrapper
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize to indented JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    # Match orjson, which writes non-ASCII text as UTF-8 rather than \u escapes
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_minute(epoch_minute_seconds: int) -> str:
+    """Format a minute-aligned Unix timestamp (seconds) in local time."""
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(epoch_minute_seconds))
 
 
 def _format_timestamp(ts: Optional[int]) -> str:
@@ -508,19 +990,57 @@ def _format_timestamp(ts: Optional[int]) -> str:
     if not ts:
         return "Unknown"
     try:
-        dt = datetime.fromtimestamp(ts / 1000)
-        return dt.strftime("%Y-%m-%d %H:%M")
+        # Output has minute precision, so notes edited in the same minute share a cache entry
+        return _format_minute(int(ts) // 60000 * 60)
     except Exception:
         return str(ts)
 
 
-def _truncate_response(result: str, item_count: int) -> str:
-    """Truncate response if it exceeds character limit."""
-    if len(result) > CHARACTER_LIMIT:
-        truncated = result[: CHARACTER_LIMIT - 200]
-        truncated += f"\n\n---\n**Response truncated** ({item_count} items). Use filters to narrow results."
-        return truncated
-    return result
+# Title prefix indexed by 2 * is_todo + todo_completed (completion only counts for to-dos)
+_TODO_PREFIXES = ("", "", "⬜ ", "✅ ")
+
+
+def _format_note_entry(note: dict) -> str:
+    """Markdown block for one note in list/search results."""
+    status = _TODO_PREFIXES[2 * bool(note.get("is_todo")) + bool(note.get("todo_completed"))]
+    return (
+        f"### {status}{note['title']}\n"
+        f"- **ID**: `{note['id']}`\n"
+        f"- **Updated**: {_format_timestamp(note.get('updated_time'))}\n"
+    )
+
+
+def _truncation_notice(item_count: int) -> str:
+    """Footer appended to responses cut at CHARACTER_LIMIT."""
+    return f"---\n**Response truncated** ({item_count} items). Use filters to narrow results."
+
+
+def _join_limited(lines: list[str], entries: Iterable[str], item_count: int) -> str:
+    """
+    Append entries to lines and join them, truncating at the character limit.
+
+    Entries are consumed lazily, so once the reply is known to overflow the
+    rest of the listing is never formatted. Trailing entries are then dropped
+    until the truncation notice fits.
+    """
+    header_count = len(lines)
+    size = sum(len(line) for line in lines) + len(lines) - 1  # Length once joined
+    for entry in entries:
+        lines.append(entry)
+        size += len(entry) + 1
+        if size > CHARACTER_LIMIT:
+            break
+    else:
+        return "\n".join(lines)
+
+    footer = ["", _truncation_notice(item_count)]
+    size += sum(len(line) + 1 for line in footer)
+    while size > CHARACTER_LIMIT and len(lines) > header_count:
+        size -= len(lines.pop()) + 1
+    if lines[-1].endswith("\n") or not lines[-1]:
+        footer.pop(0)  # Entries like note blocks already end in a blank line
+    lines.extend(footer)
+    return "\n".join(lines)
 
 
 # =============================================================================
@@ -538,20 +1058,29 @@ def _truncate_response(result: str, item_count: int) -> str:
         "openWorldHint": False,
     },
 )
-async def joplin_ensure_running() -> str:
+async def joplin_ensure_running(params: Optional[EnsureRunningInput] = None) -> str:
     """
     Ensure API ready. Launches Joplin if needed, waits for connection.
 
     Use proactively before batch operations to avoid cold-start delays.
     Returns immediately if already running. Useful for session pre-warming.
 
+    Args:
+        params: EnsureRunningInput containing:
+            - prewarm: Pre-load notebook and tag lists (default true)
+
     Returns:
         Status message: 'already_running', 'launched', or error details.
     """
+    if params is None:
+        params = EnsureRunningInput()
+
     # Check if already running and API responsive
     if _is_joplin_running():
         # Verify API is actually ready (Web Clipper enabled)
         if await _wait_for_joplin_api_ready(timeout=2.0):
+            if params.prewarm:
+                await _prewarm_cache()
             return "✅ Joplin is already running and API is ready."
 
     # Not running or API not ready - attempt launch
@@ -570,6 +1099,8 @@ async def joplin_ensure_running() -> str:
 
     # Wait for API to become ready
     if await _wait_for_joplin_api_ready():
+        if params.prewarm:
+            await _prewarm_cache()
         return "✅ Joplin launched successfully and API is ready."
 
     return (
@@ -594,6 +1125,7 @@ async def joplin_ensure_running() -> str:
         "openWorldHint": False,
     },
 )
+@_tool_errors
 async def joplin_list_notebooks(params: ListNotebooksInput) -> str:
     """
     List notebooks with IDs and hierarchy. Use to find notebook_id for filtering.
@@ -608,36 +1140,28 @@ async def joplin_list_notebooks(params: ListNotebooksInput) -> str:
     Returns:
         List of notebooks with their IDs and structure.
     """
-    try:
-        notebooks = await _get_all_paginated(
-            "folders",
-            params={"fields": "id,title,parent_id"},
-        )
-
-        if not notebooks:
-            return "No notebooks found."
+    notebooks = await _get_notebooks()
 
-        if params.response_format == ResponseFormat.JSON:
-            return json.dumps(notebooks, indent=2)
+    if not notebooks:
+        return "No notebooks found."
 
-        # Build tree structure for markdown
-        def build_tree(parent_id: str = "", level: int = 0) -> list[str]:
-            lines = []
-            for nb in notebooks:
-                if nb.get("parent_id", "") == parent_id:
-                    indent = "  " * level
-                    lines.append(f"{indent}- **{nb['title']}**")
-                    lines.append(f"{indent}  ID: `{nb['id']}`")
-                    lines.extend(build_tree(nb["id"], level + 1))
-            return lines
+    if params.response_format is ResponseFormat.JSON:
+        return _json_dumps(notebooks)
 
-        lines = ["# Joplin Notebooks", ""]
-        lines.extend(build_tree())
+    # Index children by parent once, then walk depth-first with a stack
+    children: dict[str, list[dict]] = {}
+    for nb in notebooks:
+        children.setdefault(nb.get("parent_id") or "", []).append(nb)
 
-        return "\n".join(lines)
+    def tree_entries() -> Iterator[str]:
+        stack = [(nb, 0) for nb in reversed(children.get("", []))]
+        while stack:
+            nb, level = stack.pop()
+            indent = "  " * level
+            yield f"{indent}- **{nb['title']}**\n{indent}  ID: `{nb['id']}`"
+            stack.extend((child, level + 1) for child in reversed(children.get(nb["id"], [])))
 
-    except Exception as e:
-        return _handle_error(e)
+    return _join_limited(["# Joplin Notebooks", ""], tree_entries(), len(notebooks))
 
 
 @mcp.tool(
@@ -650,6 +1174,7 @@ async def joplin_list_notebooks(params: ListNotebooksInput) -> str:
         "openWorldHint": False,
     },
 )
+@_tool_errors
 async def joplin_create_notebook(params: CreateNotebookInput) -> str:
     """
     Create notebook or return existing. Checks for duplicates by title first.
@@ -665,35 +1190,23 @@ async def joplin_create_notebook(params: CreateNotebookInput) -> str:
     Returns:
         Notebook details with ID (existing or newly created).
     """
-    try:
-        # First, check if notebook with same title already exists
-        existing_notebooks = await _get_all_paginated(
-            "folders",
-            params={"fields": "id,title,parent_id"},
-        )
-
-        # Search for exact title match (case-insensitive) at the same parent level
-        target_parent = params.parent_id or ""
-        for nb in existing_notebooks:
-            nb_parent = nb.get("parent_id", "") or ""
-            if (nb.get("title", "").lower() == params.title.lower()
-                    and nb_parent == target_parent):
-                return (
-                    f"📁 Notebook **{nb['title']}** already exists "
-                    f"(ID: `{nb['id']}`). Using existing notebook."
-                )
-
-        # No duplicate found, create new notebook
-        data: dict[str, Any] = {"title": params.title}
-        if params.parent_id:
-            data["parent_id"] = params.parent_id
+    # First, check if notebook with same title already exists
+    notebook_index = _index_notebooks(await _get_notebooks())
 
-        notebook = await _make_api_request("folders", method="POST", json_data=data)
+    # Look up exact title match (case-insensitive) at the same parent level
+    nb = notebook_index.get((params.parent_id or "", params.title.lower()))
+    if nb is not None:
+        return (
+            f"📁 Notebook **{nb['title']}** already exists "
+            f"(ID: `{nb['id']}`). Using existing notebook."
+        )
 
-        return f"✅ Created notebook **{notebook['title']}** (ID: `{notebook['id']}`)"
+    # No duplicate found, create new notebook
+    data = params.model_dump(exclude_none=True)
+    notebook = await _make_api_request("folders", method="POST", json_data=data)
+    _invalidate_cache("folders")
 
-    except Exception as e:
-        return _handle_error(e)
+    return f"✅ Created notebook **{notebook['title']}** (ID: `{notebook['id']}`)"
 
 
 # =============================================================================
@@ -711,6 +1224,7 @@ async def joplin_create_notebook(params: CreateNotebookInput) -> str:
         "openWorldHint": False,
     },
 )
+@_tool_errors
 async def joplin_list_notes(params: ListNotesInput) -> str:
     """
     List notes with IDs, titles, dates. Filter by notebook_id, sort by date/title.
@@ -729,45 +1243,33 @@ async def joplin_list_notes(params: ListNotesInput) -> str:
     Returns:
         List of notes with titles, dates, and IDs.
     """
-    try:
-        request_params = {
-            "fields": "id,title,parent_id,updated_time,created_time,is_todo,todo_completed",
-            "order_by": params.order_by.value,
-            "order_dir": "DESC" if params.order_desc else "ASC",
-        }
-
-        if params.notebook_id:
-            endpoint = f"folders/{params.notebook_id}/notes"
-        else:
-            endpoint = "notes"
+    is_json = params.response_format is ResponseFormat.JSON
 
-        notes = await _get_all_paginated(endpoint, params=request_params, limit=params.limit)
+    # Markdown only shows title, status and updated time; JSON returns full metadata
+    fields = _NOTE_LIST_FIELDS if is_json else _NOTE_SUMMARY_FIELDS
 
-        if not notes:
-            return "No notes found."
+    request_params = {
+        "fields": fields,
+        "order_by": params.order_by.value,
+        "order_dir": "DESC" if params.order_desc else "ASC",
+    }
 
-        if params.response_format == ResponseFormat.JSON:
-            return json.dumps(notes, indent=2)
+    if params.notebook_id:
+        endpoint = f"folders/{params.notebook_id}/notes"
+    else:
+        endpoint = "notes"
 
-        # Markdown format
-        lines = ["# Joplin Notes", f"*Showing {len(notes)} notes*", ""]
+    notes = await _get_all_paginated(endpoint, params=request_params, limit=params.limit)
 
-        for note in notes:
-            # Todo indicator
-            if note.get("is_todo"):
-                status = "✅" if note.get("todo_completed") else "⬜"
-                lines.append(f"### {status} {note['title']}")
-            else:
-                lines.append(f"### {note['title']}")
-
-            lines.append(f"- **ID**: `{note['id']}`")
-            lines.append(f"- **Updated**: {_format_timestamp(note.get('updated_time'))}")
-            lines.append("")
+    if not notes:
+        return "No notes found."
 
-        return _truncate_response("\n".join(lines), len(notes))
+    if is_json:
+        return _json_dumps(notes)
 
-    except Exception as e:
-        return _handle_error(e)
+    # Markdown format
+    lines = ["# Joplin Notes", f"*Showing {len(notes)} notes*", ""]
+    return _join_limited(lines, map(_format_note_entry, notes), len(notes))
 
 
 @mcp.tool(
@@ -780,6 +1282,7 @@ async def joplin_list_notes(params: ListNotesInput) -> str:
         "openWorldHint": False,
     },
 )
+@_tool_errors
 async def joplin_get_note(params: GetNoteInput) -> str:
     """
     Get note by ID with full Markdown content. Includes metadata and body.
@@ -796,43 +1299,44 @@ async def joplin_get_note(params: GetNoteInput) -> str:
     Returns:
         Note details including content if requested.
     """
-    try:
-        fields = "id,title,parent_id,updated_time,created_time,is_todo,todo_completed,source_url"
-        if params.include_body:
-            fields += ",body"
-
+    if params.include_body:
         note = await _make_api_request(
             f"notes/{params.note_id}",
-            params={"fields": fields},
+            params={"fields": _NOTE_FIELDS_WITH_BODY},
         )
+    else:
+        note = _get_cached_note_meta(params.note_id)
+        if note is None:
+            note = await _make_api_request(
+                f"notes/{params.note_id}",
+                params={"fields": _NOTE_FIELDS},
+            )
+            _cache_note_meta(params.note_id, note)
 
-        if params.response_format == ResponseFormat.JSON:
-            return json.dumps(note, indent=2)
-
-        # Markdown format
-        lines = [f"# {note['title']}", ""]
+    if params.response_format is ResponseFormat.JSON:
+        return _json_dumps(note)
 
-        if note.get("is_todo"):
-            status = "Completed ✅" if note.get("todo_completed") else "Pending ⬜"
-            lines.append(f"**Status**: {status}")
+    # Markdown format
+    lines = [f"# {note['title']}", ""]
 
-        lines.extend([
-            f"- **ID**: `{note['id']}`",
-            f"- **Notebook**: `{note.get('parent_id', 'Unknown')}`",
-            f"- **Created**: {_format_timestamp(note.get('created_time'))}",
-            f"- **Updated**: {_format_timestamp(note.get('updated_time'))}",
-        ])
+    if note.get("is_todo"):
+        status = "Completed ✅" if note.get("todo_completed") else "Pending ⬜"
+        lines.append(f"**Status**: {status}")
 
-        if note.get("source_url"):
-            lines.append(f"- **Source**: {note['source_url']}")
+    lines.append(
+        f"- **ID**: `{note['id']}`\n"
+        f"- **Notebook**: `{note.get('parent_id', 'Unknown')}`\n"
+        f"- **Created**: {_format_timestamp(note.get('created_time'))}\n"
+        f"- **Updated**: {_format_timestamp(note.get('updated_time'))}"
+    )
 
-        if params.include_body and note.get("body"):
-            lines.extend(["", "---", "", note["body"]])
+    if note.get("source_url"):
+        lines.append(f"- **Source**: {note['source_url']}")
 
-        return "\n".join(lines)
+    if params.include_body and note.get("body"):
+        lines.extend(["", "---", "", note["body"]])
 
-    except Exception as e:
-        return _handle_error(e)
+    return "\n".join(lines)
 
 
 @mcp.tool(
@@ -845,6 +1349,7 @@ async def joplin_get_note(params: GetNoteInput) -> str:
         "openWorldHint": False,
     },
 )
+@_tool_errors
 async def joplin_create_note(params: CreateNoteInput) -> str:
     """
     Create note with Markdown body, optional tags, to-do support.
@@ -863,59 +1368,41 @@ async def joplin_create_note(params: CreateNoteInput) -> str:
     Returns:
         Created note details with ID.
     """
+    data = params.model_dump(by_alias=True, exclude_none=True, exclude={"tags", "is_todo"})
+    if params.is_todo:
+        data["is_todo"] = 1
+
+    # One entry per tag name (case-insensitive) so a repeated name can't create two tags
+    tag_names = list({name.lower(): name for name in reversed(params.tags or [])}.values())
+
+    # Look existing tags up while the note is created; nothing is written until the note exists
+    lookups = asyncio.gather(*(_find_tag_id(name) for name in tag_names), return_exceptions=True)
     try:
-        data: dict[str, Any] = {
-            "title": params.title,
-            "body": params.body,
-        }
-
-        if params.notebook_id:
-            data["parent_id"] = params.notebook_id
-        if params.is_todo:
-            data["is_todo"] = 1
-
-        note = await _make_api_request("notes", method="POST", json_data=data)
-
-        # Add tags if specified
-        if params.tags:
-            for tag_name in params.tags:
-                try:
-                    # Search for existing tag
-                    tags = await _make_api_request(
-                        "search",
-                        params={"query": tag_name, "type": "tag"},
-                    )
-
-                    tag_id = None
-                    if isinstance(tags, dict) and tags.get("items"):
-                        for t in tags["items"]:
-                            if t.get("title", "").lower() == tag_name.lower():
-                                tag_id = t["id"]
-                                break
-
-                    # Create tag if not found
-                    if not tag_id:
-                        new_tag = await _make_api_request(
-                            "tags",
-                            method="POST",
-                            json_data={"title": tag_name},
-                        )
-                        tag_id = new_tag["id"]
-
-                    # Add tag to note
-                    await _make_api_request(
-                        f"tags/{tag_id}/notes",
-                        method="POST",
-                        json_data={"id": note["id"]},
-                    )
-                except Exception:
-                    pass  # Continue even if tagging fails
-
-        note_type = "to-do" if params.is_todo else "note"
-        return f"✅ Created {note_type} **{note['title']}** (ID: `{note['id']}`)"
-
-    except Exception as e:
-        return _handle_error(e)
+        note = await _make_api_request(
+            "notes", method="POST", json_data=data, params={"fields": "id"}
+        )
+    except BaseException:
+        lookups.cancel()
+        with suppress(asyncio.CancelledError):
+            await lookups
+        raise
+    found_ids = await lookups
+
+    async def attach(name: str, tag_id: Any) -> None:
+        if tag_id is None:
+            tag_id = await _create_tag(name)
+        elif isinstance(tag_id, Exception):
+            tag_id = await _resolve_tag_id(name)  # Lookup failed; try once more
+        await _attach_tag(note["id"], tag_id)
+
+    # Create missing tags and attach all of them in parallel
+    await asyncio.gather(
+        *(attach(name, tag_id) for name, tag_id in zip(tag_names, found_ids)),
+        return_exceptions=True,  # Continue even if tagging fails
+    )
+
+    note_type = "to-do" if params.is_todo else "note"
+    return f"✅ Created {note_type} **{params.title}** (ID: `{note['id']}`)"
 
 
 @mcp.tool(
@@ -928,6 +1415,7 @@ async def joplin_create_note(params: CreateNoteInput) -> str:
         "openWorldHint": False,
     },
 )
+@_tool_errors
 async def joplin_update_note(params: UpdateNoteInput) -> str:
     """
     Update note title, body, or move to different notebook. Partial updates OK.
@@ -947,34 +1435,30 @@ async def joplin_update_note(params: UpdateNoteInput) -> str:
     Returns:
         Confirmation that the note was updated.
     """
-    try:
-        data: dict[str, Any] = {}
-
-        if params.title is not None:
-            data["title"] = params.title
-        if params.body is not None:
-            data["body"] = params.body
-        if params.notebook_id is not None:
-            data["parent_id"] = params.notebook_id
-        if params.is_todo is not None:
-            data["is_todo"] = 1 if params.is_todo else 0
-        if params.todo_completed is not None:
-            data["todo_completed"] = int(datetime.now().timestamp() * 1000) if params.todo_completed else 0
-
-        if not data:
-            return "Error: No fields to update. Provide at least one field to change."
-
-        note = await _make_api_request(
-            f"notes/{params.note_id}",
-            method="PUT",
-            json_data=data,
-        )
-
-        title = params.title or note.get("title", "Note")
-        return f"✅ Updated note **{title}** (ID: `{params.note_id}`)"
+    data = params.model_dump(
+        by_alias=True,
+        exclude_none=True,
+        exclude={"note_id", "is_todo", "todo_completed"},
+    )
+    if params.is_todo is not None:
+        data["is_todo"] = 1 if params.is_todo else 0
+    if params.todo_completed is not None:
+        data["todo_completed"] = time.time_ns() // 1_000_000 if params.todo_completed else 0
+
+    if not data:
+        return "Error: No fields to update. Provide at least one field to change."
+
+    # Only ask for the title back when the confirmation needs it
+    note = await _make_api_request(
+        f"notes/{params.note_id}",
+        method="PUT",
+        json_data=data,
+        params={"fields": "id" if params.title else "id,title"},
+    )
+    _note_meta_cache.pop(params.note_id, None)
 
-    except Exception as e:
-        return _handle_error(e)
+    title = params.title or (note or {}).get("title", "Note")
+    return f"✅ Updated note **{title}** (ID: `{params.note_id}`)"
 
 
 @mcp.tool(
@@ -987,6 +1471,7 @@ async def joplin_update_note(params: UpdateNoteInput) -> str:
         "openWorldHint": False,
     },
 )
+@_tool_errors
 async def joplin_delete_note(params: DeleteNoteInput) -> str:
     """
     ⚠️ Delete note permanently. Cannot be undone.
@@ -998,12 +1483,9 @@ async def joplin_delete_note(params: DeleteNoteInput) -> str:
     Returns:
         Confirmation that the note was deleted.
     """
-    try:
-        await _make_api_request(f"notes/{params.note_id}", method="DELETE")
-        return f"🗑️ Deleted note (ID: `{params.note_id}`)"
-
-    except Exception as e:
-        return _handle_error(e)
+    await _make_api_request(f"notes/{params.note_id}", method="DELETE")
+    _note_meta_cache.pop(params.note_id, None)
+    return f"🗑️ Deleted note (ID: `{params.note_id}`)"
 
 
 @mcp.tool(
@@ -1016,6 +1498,7 @@ async def joplin_delete_note(params: DeleteNoteInput) -> str:
         "openWorldHint": False,
     },
 )
+@_tool_errors
 async def joplin_search_notes(params: SearchNotesInput) -> str:
     """
     Search notes. Supports title:, body:, tag:, notebook:, type: prefixes.
@@ -1032,47 +1515,34 @@ async def joplin_search_notes(params: SearchNotesInput) -> str:
     Returns:
         Matching notes with their details.
     """
-    try:
-        result = await _make_api_request(
-            "search",
-            params={
-                "query": params.query,
-                "type": "note",
-                "fields": "id,title,parent_id,updated_time,is_todo,todo_completed",
-                "limit": params.limit,
-            },
-        )
-
-        items = result.get("items", []) if isinstance(result, dict) else result
-
-        if not items:
-            return f"No notes found matching '{params.query}'."
-
-        if params.response_format == ResponseFormat.JSON:
-            return json.dumps(items, indent=2)
-
-        # Markdown format
-        lines = [
-            f"# Search Results: '{params.query}'",
-            f"*Found {len(items)} notes*",
-            "",
-        ]
+    is_json = params.response_format is ResponseFormat.JSON
+    fields = _SEARCH_NOTE_FIELDS if is_json else _NOTE_SUMMARY_FIELDS
+
+    result = await _make_api_request(
+        "search",
+        params={
+            "query": params.query,
+            "type": "note",
+            "fields": fields,
+            "limit": params.limit,
+        },
+    )
 
-        for note in items:
-            if note.get("is_todo"):
-                status = "✅" if note.get("todo_completed") else "⬜"
-                lines.append(f"### {status} {note['title']}")
-            else:
-                lines.append(f"### {note['title']}")
+    items = result.get("items", []) if isinstance(result, dict) else result
 
-            lines.append(f"- **ID**: `{note['id']}`")
-            lines.append(f"- **Updated**: {_format_timestamp(note.get('updated_time'))}")
-            lines.append("")
+    if not items:
+        return f"No notes found matching '{params.query}'."
 
-        return _truncate_response("\n".join(lines), len(items))
+    if is_json:
+        return _json_dumps(items)
 
-    except Exception as e:
-        return _handle_error(e)
+    # Markdown format
+    lines = [
+        f"# Search Results: '{params.query}'",
+        f"*Found {len(items)} notes*",
+        "",
+    ]
+    return _join_limited(lines, map(_format_note_entry, items), len(items))
 
 
 # =============================================================================
@@ -1090,6 +1560,7 @@ async def joplin_search_notes(params: SearchNotesInput) -> str:
         "openWorldHint": False,
     },
 )
+@_tool_errors
 async def joplin_list_tags(params: ListTagsInput) -> str:
     """
     List all tags with IDs. Use for tag: search prefix or tag_note operations.
@@ -1103,27 +1574,20 @@ async def joplin_list_tags(params: ListTagsInput) -> str:
     Returns:
         List of tags with IDs.
     """
-    try:
-        tags = await _get_all_paginated(
-            "tags",
-            params={"fields": "id,title"},
-        )
+    tags = await _get_tags()
 
-        if not tags:
-            return "No tags found."
+    if not tags:
+        return "No tags found."
 
-        if params.response_format == ResponseFormat.JSON:
-            return json.dumps(tags, indent=2)
+    if params.response_format is ResponseFormat.JSON:
+        return _json_dumps(tags)
 
-        # Markdown format
-        lines = ["# Joplin Tags", ""]
-        for tag in sorted(tags, key=lambda t: t.get("title", "").lower()):
-            lines.append(f"- **{tag['title']}** (ID: `{tag['id']}`)")
-
-        return "\n".join(lines)
-
-    except Exception as e:
-        return _handle_error(e)
+    # Markdown format
+    entries = (
+        f"- **{tag['title']}** (ID: `{tag['id']}`)"
+        for tag in _sort_tags(tags)
+    )
+    return _join_limited(["# Joplin Tags", ""], entries, len(tags))
 
 
 @mcp.tool(
@@ -1136,6 +1600,7 @@ async def joplin_list_tags(params: ListTagsInput) -> str:
         "openWorldHint": False,
     },
 )
+@_tool_errors
 async def joplin_tag_note(params: TagNoteInput) -> str:
     """
     Add tag to note. Creates tag automatically if it doesn't exist.
@@ -1150,40 +1615,8 @@ async def joplin_tag_note(params: TagNoteInput) -> str:
     Returns:
         Confirmation that the tag was added.
     """
-    try:
-        # Search for existing tag
-        tags = await _make_api_request(
-            "search",
-            params={"query": params.tag, "type": "tag"},
-        )
-
-        tag_id = None
-        if isinstance(tags, dict) and tags.get("items"):
-            for t in tags["items"]:
-                if t.get("title", "").lower() == params.tag.lower():
-                    tag_id = t["id"]
-                    break
-
-        # Create tag if not found
-        if not tag_id:
-            new_tag = await _make_api_request(
-                "tags",
-                method="POST",
-                json_data={"title": params.tag},
-            )
-            tag_id = new_tag["id"]
-
-        # Add tag to note
-        await _make_api_request(
-            f"tags/{tag_id}/notes",
-            method="POST",
-            json_data={"id": params.note_id},
-        )
-
-        return f"✅ Added tag **{params.tag}** to note `{params.note_id}`"
-
-    except Exception as e:
-        return _handle_error(e)
+    await _ensure_and_attach_tag(params.note_id, params.tag)
+    return f"✅ Added tag **{params.tag}** to note `{params.note_id}`"
 
 
 # =============================================================================